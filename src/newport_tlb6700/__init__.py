@@ -1 +1,2 @@
+from .async_driver import AsyncTLB6700
 from .tlb6700 import TLB6700, NewportUSB, list_devices
@@ -0,0 +1,116 @@
+"""Non-blocking interface for the TLB-6700 Tunable Laser Controller.
+
+All USB traffic runs on a single worker thread so callers (GUIs,
+measurement loops, asyncio code) are never blocked waiting for the laser
+to reply.
+"""
+
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future
+
+from .tlb6700 import TLB6700
+
+# TLB6700 methods that must run on the I/O thread as part of a submit() call
+_NOT_WRAPPED = frozenset(("pipeline",))
+
+
+class AsyncTLB6700:
+    """Asynchronous wrapper around TLB6700.
+
+    Every public TLB6700 method ``name`` is available in two forms:
+    ``name_async(...)`` returns a ``concurrent.futures.Future`` and
+    ``await name(...)`` is a coroutine for use with asyncio. Commands are
+    executed in the order they were submitted. To run a pipelined block,
+    pass a function using ``laser.pipeline()`` to ``submit``.
+
+    Args:
+        device_id: Device ID from NewportUSB.list_devices()
+        usb: Optional NewportUSB instance (creates one if not provided)
+        **kwargs: Extra keyword arguments passed to TLB6700
+    """
+
+    def __init__(self, device_id, usb=None, **kwargs):
+        self._laser = TLB6700(device_id, usb=usb, **kwargs)
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._worker, name=f"TLB6700-{device_id}", daemon=True
+        )
+        self._thread.start()
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+
+            func, args, kwargs, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(self._laser, *args, **kwargs))
+            except BaseException as exc:
+                future.set_exception(exc)
+
+    def submit(self, func, *args, **kwargs):
+        """Run func(laser, *args, **kwargs) on the I/O thread.
+
+        Args:
+            func: Callable taking the underlying TLB6700 as first argument
+
+        Returns:
+            Future resolving to the return value of func
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AsyncTLB6700 is closed")
+            self._queue.put((func, args, kwargs, future))
+        return future
+
+    def close(self):
+        """Finish pending commands and stop the I/O thread."""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _make_future_method(name, func):
+    def method(self, *args, **kwargs):
+        return self.submit(func, *args, **kwargs)
+
+    method.__name__ = f"{name}_async"
+    method.__qualname__ = f"AsyncTLB6700.{name}_async"
+    method.__doc__ = f"{func.__doc__}\n\nReturns a Future with the result."
+    return method
+
+
+def _make_coroutine_method(name, func):
+    async def method(self, *args, **kwargs):
+        future = self.submit(func, *args, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    method.__name__ = name
+    method.__qualname__ = f"AsyncTLB6700.{name}"
+    method.__doc__ = func.__doc__
+    return method
+
+
+for _name in dir(TLB6700):
+    _func = getattr(TLB6700, _name)
+    if _name.startswith("_") or _name in _NOT_WRAPPED or not callable(_func):
+        continue
+    setattr(AsyncTLB6700, f"{_name}_async", _make_future_method(_name, _func))
+    setattr(AsyncTLB6700, _name, _make_coroutine_method(_name, _func))
+del _name, _func
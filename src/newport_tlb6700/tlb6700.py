@@ -1,9 +1,65 @@
 """Python library for controlling the TLB-6700 Tunable Laser Controller
 via Newport USB DLL."""
 
+import contextlib
 import ctypes
+import re
+import threading
 import time
 
+# Matches one "<device_id>,<description>" entry in the device info string
+_DEV_RE = re.compile(rb"(\d+),([^;]+)")
+
+# Accepted set_output() arguments (True == 1 and False == 0 as dict keys)
+_OUTPUT_MAP = {True: b"ON", False: b"OFF", "ON": b"ON", "OFF": b"OFF"}
+
+_CONTROL_MODES = {"REM": b"REM", "LOC": b"LOC"}
+
+# Seconds to wait before polling for a reply to commands that change a
+# lot of controller state; other commands are polled immediately
+_CMD_MIN_WAIT = {b"*RST": 0.5, b"*RCL": 0.25, b"*SAV": 0.25}
+
+# Inclusive limits for numeric setter arguments as (low, high, label, unit)
+_RANGES = {
+    "recall_bin": (0, 5, "Recall bin", ""),
+    "save_bin": (2, 5, "Save bin", ""),
+    "beep": (0, 2, "Beep state", ""),
+    "brightness": (1, 100, "Brightness", "%"),
+    "lockout": (0, 2, "Lockout mode", ""),
+    "on_delay": (3000, 60000, "On delay", " ms"),
+    "piezo_voltage": (0, 100, "Piezo voltage", "%"),
+}
+
+
+def _min_wait(command):
+    """Return the settle time needed before reading a reply to command."""
+    if b"*" not in command:
+        return 0.0
+    return max(
+        _CMD_MIN_WAIT.get(part[:4], 0.0) for part in command.split(b";")
+    )
+
+
+def _check_range(value, lo, hi, field, unit=""):
+    """Raise ValueError if value is outside lo-hi inclusive."""
+    if not lo <= value <= hi:
+        raise ValueError(f"{field} must be {lo}-{hi}{unit}")
+
+
+def _encode_value(value):
+    """Encode a command argument exactly as str() formats it."""
+    return str(value).encode("ascii")
+
+
+def _encode_setpoint(value):
+    """Encode a numeric setpoint or 'MAX' as command bytes."""
+    if isinstance(value, str):
+        if value.upper() != "MAX":
+            raise ValueError("String value must be 'MAX'")
+        return b"MAX"
+    return _encode_value(value)
+
+
 class NewportUSB:
     """Singleton wrapper for Newport USB DLL.
 
@@ -12,20 +68,35 @@ class NewportUSB:
 
     Args:
         dll_path: Optional path to UsbDll.dll. If not provided, searches standard Windows paths.
+        enum_ttl: Seconds list_devices() reuses its last result (0
+            disables). Change it later by setting NewportUSB().enum_ttl.
+
+    Since the instance is shared, constructor arguments only take effect on
+    the first construction and are ignored afterwards.
     """
 
+    __slots__ = ("dll", "enum_ttl", "_dev_cache", "_dev_cache_time")
+
     _instance = None
     _initialized = False
+    _system_initialized = False
     _dll_path = None
+    _init_lock = threading.Lock()
 
-    def __new__(cls, dll_path=None):
+    def __new__(cls, dll_path=None, enum_ttl=1.0):
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._dll_path = dll_path
+            with cls._init_lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._dll_path = dll_path
         return cls._instance
 
-    def __init__(self, dll_path=None):
-        if not self._initialized:
+    def __init__(self, dll_path=None, enum_ttl=1.0):
+        if self._initialized:
+            return
+        with self._init_lock:
+            if NewportUSB._initialized:
+                return
             try:
                 dll_name = self._dll_path if self._dll_path else "UsbDll.dll"
                 self.dll = ctypes.WinDLL(dll_name)
@@ -35,6 +106,9 @@ class NewportUSB:
                 )
 
             self._setup_functions()
+            self.enum_ttl = enum_ttl
+            self._dev_cache = None
+            self._dev_cache_time = 0.0
             NewportUSB._initialized = True
 
     def _setup_functions(self):
@@ -62,24 +136,49 @@ class NewportUSB:
         ]
         self.dll.newp_usb_get_ascii.restype = ctypes.c_long
 
-    def init_system(self):
-        """Initialize USB system and open all devices."""
-        result = self.dll.newp_usb_init_system()
-        if result != 0:
-            raise RuntimeError(
-                f"Failed to initialize USB system: error code {result}"
-            )
+    def init_system(self, force=False):
+        """Initialize USB system and open all devices.
+
+        Does nothing if the system is already initialized, unless force is
+        set.
+
+        Args:
+            force: Re-run initialization even if already initialized
+        """
+        with self._init_lock:
+            if NewportUSB._system_initialized and not force:
+                return
+            result = self.dll.newp_usb_init_system()
+            if result != 0:
+                raise RuntimeError(
+                    f"Failed to initialize USB system: error code {result}"
+                )
+            self._dev_cache = None
+            NewportUSB._system_initialized = True
 
     def close_system(self):
         """Close all USB devices."""
-        self.dll.newp_usb_uninit_system()
+        with self._init_lock:
+            self.dll.newp_usb_uninit_system()
+            self._dev_cache = None
+            NewportUSB._system_initialized = False
 
     def list_devices(self):
         """List all connected devices.
 
+        Results are reused for enum_ttl seconds to avoid re-enumerating the
+        bus when called repeatedly.
+
         Returns:
             List of tuples (device_id, description) for each connected device
         """
+        now = time.monotonic()
+        if (
+            self._dev_cache is not None
+            and now - self._dev_cache_time < self.enum_ttl
+        ):
+            return list(self._dev_cache)
+
         buffer = ctypes.create_string_buffer(4096)
         result = self.dll.newp_usb_get_device_info(buffer)
 
@@ -88,18 +187,12 @@ class NewportUSB:
                 f"Failed to get device info: error code {result}"
             )
 
-        device_info = buffer.value.decode("ascii")
-        devices = []
-
-        for device_str in device_info.split(";"):
-            if device_str.strip():
-                parts = device_str.split(",", 1)
-                if len(parts) == 2:
-                    device_id = int(parts[0])
-                    description = parts[1]
-                    devices.append((device_id, description))
-
-        return devices
+        self._dev_cache = [
+            (int(match.group(1)), match.group(2).decode("ascii"))
+            for match in _DEV_RE.finditer(buffer.value)
+        ]
+        self._dev_cache_time = now
+        return list(self._dev_cache)
 
 
 class TLB6700:
@@ -108,59 +201,260 @@ class TLB6700:
     Args:
         device_id: Device ID from NewportUSB.list_devices()
         usb: Optional NewportUSB instance (creates one if not provided)
+        timeout: Seconds to wait for a response before giving up
+        poll_interval: Seconds to sleep between polls for a response
+        pipelining: Whether the controller accepts ';'-chained set
+            commands. If False, pipeline() still buffers commands but
+            sends them one per transaction.
     """
 
-    def __init__(self, device_id, usb=None):
+    __slots__ = (
+        "device_id",
+        "usb",
+        "timeout",
+        "poll_interval",
+        "pipelining",
+        "_send_fn",
+        "_get_fn",
+        "_dev_id_c",
+        "_rx_buf",
+        "_rx_len",
+        "_rx_cap",
+        "_rx_accum",
+        "_tx_buf",
+        "_tx_len",
+        "_identity_cache",
+        "_pipeline",
+    )
+
+    def __init__(
+        self,
+        device_id,
+        usb=None,
+        timeout=1.0,
+        poll_interval=0.001,
+        pipelining=True,
+    ):
         self.device_id = device_id
         self.usb = usb if usb is not None else NewportUSB()
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.pipelining = pipelining
+
+        # Resolve the DLL functions and build the ctypes arguments once so
+        # each command avoids the attribute lookups and allocations.
+        self._send_fn = self.usb.dll.newp_usb_send_ascii
+        self._get_fn = self.usb.dll.newp_usb_get_ascii
+        self._dev_id_c = ctypes.c_long(device_id)
+        self._rx_buf = ctypes.create_string_buffer(1024)
+        self._rx_len = ctypes.c_ulong()
+        self._rx_cap = ctypes.c_ulong(1024)
+        self._rx_accum = bytearray()
+        self._tx_buf = ctypes.create_string_buffer(1024)
+        self._tx_len = ctypes.c_ulong()
+        self._identity_cache = {}
+        self._pipeline = None
 
     def _send_command(self, command):
-        """Send command and return response."""
-        cmd_bytes = command.encode("ascii")
-        result = self.usb.dll.newp_usb_send_ascii(
-            ctypes.c_long(self.device_id),
-            cmd_bytes,
-            ctypes.c_ulong(len(cmd_bytes)),
-        )
+        """Send command bytes and return the raw response bytes."""
+        if self._pipeline:
+            self._flush_pipeline()
+
+        # Copy into the reusable transmit buffer, growing it for long
+        # pipelined or batched commands. NUL-terminate so no bytes from an
+        # earlier, longer command follow this one.
+        length = len(command)
+        if length >= len(self._tx_buf):
+            self._tx_buf = ctypes.create_string_buffer(length + 1)
+        ctypes.memmove(self._tx_buf, command, length)
+        self._tx_buf[length] = b"\0"
+        self._tx_len.value = length
+        result = self._send_fn(self._dev_id_c, self._tx_buf, self._tx_len)
 
         if result != 0:
             raise RuntimeError(f"Failed to send command: error code {result}")
 
-        time.sleep(0.05)
-
-        buffer = ctypes.create_string_buffer(1024)
-        bytes_read = ctypes.c_ulong()
-
-        result = self.usb.dll.newp_usb_get_ascii(
-            ctypes.c_long(self.device_id),
-            buffer,
-            ctypes.c_ulong(1024),
-            ctypes.byref(bytes_read),
-        )
-
-        response = buffer.value.decode("ascii").split("\n")[0]
+        wait = _min_wait(command)
+        if wait:
+            time.sleep(wait)
+
+        # Poll until the controller replies instead of sleeping a fixed
+        # amount, so fast replies are returned as soon as they arrive. Long
+        # replies may arrive over several reads, so keep reading until the
+        # terminator is seen.
+        self._rx_accum.clear()
+        deadline = time.perf_counter() + self.timeout
+        while True:
+            # Reset the length so a read that returns nothing is not
+            # mistaken for a repeat of the previous chunk.
+            self._rx_len.value = 0
+            result = self._get_fn(
+                self._dev_id_c,
+                self._rx_buf,
+                self._rx_cap,
+                ctypes.byref(self._rx_len),
+            )
+            bytes_read = self._rx_len.value
+            if bytes_read > 0:
+                self._rx_accum += ctypes.string_at(self._rx_buf, bytes_read)
+                end = self._rx_accum.find(b"\r")
+                if end >= 0:
+                    break
+            if time.perf_counter() >= deadline:
+                raise RuntimeError(
+                    f"Timed out waiting for response to {command!r}: "
+                    f"last read error code {result}"
+                )
+            if bytes_read == 0:
+                time.sleep(self.poll_interval)
 
-        if not response.endswith("\r"):
-            raise RuntimeError(f"Failed to read response: error code {result}")
+        # Slice out the reply in one pass, skipping a line feed left over
+        # from the previous reply's "\r\n" terminator.
+        start = 1 if self._rx_accum.startswith(b"\n") else 0
+        return bytes(self._rx_accum[start:end])
 
-        return response.strip()
+    def _query_raw(self, command):
+        """Send query command and return response bytes."""
+        response = self._send_command(command)
+        if response.startswith(b"ERROR"):
+            raise RuntimeError(response.decode("ascii"))
+        return response
 
     def _query(self, command):
         """Send query command and return response."""
-        response = self._send_command(command)
-        if response.startswith("ERROR"):
-            raise RuntimeError(response)
-        return response
+        return self._query_raw(command).decode("ascii")
+
+    def _query_float(self, command):
+        """Send query command and parse response as a float."""
+        return float(self._query_raw(command))
+
+    def _query_int(self, command):
+        """Send query command and parse response as an int."""
+        return int(self._query_raw(command))
 
     def _set(self, command):
         """Send set command and verify OK response."""
+        if self._pipeline is not None:
+            self._pipeline.append(command)
+            return
+
         response = self._send_command(command)
-        if response != "OK":
-            raise RuntimeError(f"Command failed: {response}")
+        if response != b"OK":
+            raise RuntimeError(f"Command failed: {response.decode('ascii')}")
+
+    def _flush_pipeline(self):
+        """Send buffered set commands as one transaction."""
+        pending = self._pipeline
+        self._pipeline = []
+        if not self.pipelining:
+            for command in pending:
+                response = self._send_command(command)
+                if response != b"OK":
+                    raise RuntimeError(
+                        f"Command failed: {response.decode('ascii')}"
+                    )
+            return
+
+        response = self._send_command(b";".join(pending))
+        items = response.split(b";")
+        if len(items) != len(pending):
+            raise RuntimeError(
+                f"Expected {len(pending)} responses, got: "
+                f"{response.decode('ascii')}"
+            )
+        for item in items:
+            if item != b"OK":
+                raise RuntimeError(
+                    f"Command failed: {response.decode('ascii')}"
+                )
+
+    @contextlib.contextmanager
+    def pipeline(self):
+        """Buffer set commands and send them in a single USB transaction.
+
+        Set commands issued inside the block are sent together when it
+        exits; queries flush the buffer first so ordering is kept. Nothing
+        buffered is sent if the block raises. The controller must reply
+        with one OK per command. For controllers that do not accept
+        chained commands, construct TLB6700 with pipelining=False.
+
+        Example:
+            with laser.pipeline():
+                laser.set_wavelength_setpoint(1550)
+                laser.set_diode_current(150)
+                laser.set_output(True)
+        """
+        if self._pipeline is not None:
+            yield self
+            return
+
+        self._pipeline = []
+        try:
+            yield self
+            if self._pipeline:
+                self._flush_pipeline()
+        finally:
+            self._pipeline = None
+
+    def _query_identity(self, command):
+        """Query a value that is fixed for the connection, caching it."""
+        response = self._identity_cache.get(command)
+        if response is None:
+            response = self._query(command)
+            self._identity_cache[command] = response
+        return response
+
+    def invalidate_identity_cache(self):
+        """Forget cached identification and laser head info.
+
+        Clears the values cached by get_identification, get_laser_model,
+        get_laser_serial, get_laser_revision and
+        get_laser_calibration_date.
+        """
+        self._identity_cache.clear()
+
+    def _query_many(self, command, count):
+        """Send ';'-joined queries and split the reply into count values."""
+        response = self._query(command)
+        responses = response.split(";")
+        if len(responses) != count:
+            raise RuntimeError(f"Expected {count} responses, got: {response}")
+        for field in responses:
+            if field.startswith("ERROR"):
+                raise RuntimeError(field)
+        return responses
+
+    def query_many(self, commands):
+        """Send several queries in one USB transaction.
+
+        Args:
+            commands: List of query command strings
+
+        Returns:
+            List of response strings, one per command
+        """
+        if not commands:
+            raise ValueError("At least one command is required")
+        return self._query_many(
+            ";".join(commands).encode("ascii"), len(commands)
+        )
+
+    def read_sensor_snapshot(self):
+        """Read all sensor values in a single USB transaction.
+
+        Returns:
+            Dict with diode_current (mA), diode_temperature (°C),
+            cavity_temperature (°C), auxiliary_voltage (V), power and
+            wavelength (nm)
+        """
+        responses = self._query_many(_SENSOR_SNAPSHOT_CMD, len(_SENSOR_NAMES))
+        return {
+            name: float(value) for name, value in zip(_SENSOR_NAMES, responses)
+        }
 
     def get_identification(self):
         """Get instrument identification string."""
-        return self._query("*IDN?")
+        return self._query_identity(b"*IDN?")
 
     def recall_settings(self, bin):
         """Recall saved settings from memory.
@@ -168,13 +462,12 @@ class TLB6700:
         Args:
             bin: 0 for factory defaults, 1-5 for saved settings
         """
-        if bin < 0 or bin > 5:
-            raise ValueError("Bin must be 0-5")
-        self._set(f"*RCL {bin}")
+        _check_range(bin, *_RANGES["recall_bin"])
+        self._set(b"*RCL " + _encode_value(bin))
 
     def reset(self):
         """Perform soft reset of the controller."""
-        self._set("*RST")
+        self._set(b"*RST")
 
     def save_settings(self, bin):
         """Save current settings to memory.
@@ -182,9 +475,8 @@ class TLB6700:
         Args:
             bin: Memory location 2-5
         """
-        if bin < 2 or bin > 5:
-            raise ValueError("Bin must be 2-5")
-        self._set(f"*SAV {bin}")
+        _check_range(bin, *_RANGES["save_bin"])
+        self._set(b"*SAV " + _encode_value(bin))
 
     def get_operation_complete(self):
         """Check if long-term operation is complete.
@@ -192,8 +484,7 @@ class TLB6700:
         Returns:
             True if no operation in progress, False otherwise
         """
-        response = self._query("*OPC?")
-        return response == "1"
+        return self._query_raw(b"*OPC?") == b"1"
 
     def get_status_byte(self):
         """Get controller status byte.
@@ -201,8 +492,7 @@ class TLB6700:
         Returns:
             0 if error buffer empty, 128 if errors present
         """
-        response = self._query("*STB?")
-        return int(response)
+        return self._query_int(b"*STB?")
 
     def set_beep(self, state):
         """Control the beeper.
@@ -211,14 +501,12 @@ class TLB6700:
             state: 0/False for off, 1/True for on, 2 for test beep
         """
         value = int(state)
-        if value < 0 or value > 2:
-            raise ValueError("State must be 0, 1, or 2")
-        self._set(f"BEEP {value}")
+        _check_range(value, *_RANGES["beep"])
+        self._set(b"BEEP %d" % value)
 
     def get_beep(self):
         """Get beeper enable status."""
-        response = self._query("BEEP?")
-        return response == "1"
+        return self._query_raw(b"BEEP?") == b"1"
 
     def set_brightness(self, brightness):
         """Set display brightness.
@@ -226,18 +514,8 @@ class TLB6700:
         Args:
             brightness: Percentage from 1 to 100
         """
-        if brightness < 1 or brightness > 100:
-            raise ValueError("Brightness must be 1-100")
-        self._set(f"BRIGHT {brightness}")
-
-    def get_brightness(self):
-        """Get display brightness percentage."""
-        response = self._query("BRIGHT?")
-        return int(response)
-
-    def get_error_string(self):
-        """Get next error from error buffer."""
-        return self._query("ERRSTR?")
+        _check_range(brightness, *_RANGES["brightness"])
+        self._set(b"BRIGHT " + _encode_value(brightness))
 
     def set_lockout(self, mode):
         """Set front panel lockout mode.
@@ -245,14 +523,8 @@ class TLB6700:
         Args:
             mode: 0 = all enabled, 1 = all disabled, 2 = dial only disabled
         """
-        if mode < 0 or mode > 2:
-            raise ValueError("Mode must be 0, 1, or 2")
-        self._set(f"LOCKOUT {mode}")
-
-    def get_lockout(self):
-        """Get front panel lockout state."""
-        response = self._query("LOCKOUT?")
-        return int(response)
+        _check_range(mode, *_RANGES["lockout"])
+        self._set(b"LOCKOUT " + _encode_value(mode))
 
     def set_on_delay(self, milliseconds):
         """Set laser turn-on delay.
@@ -260,14 +532,8 @@ class TLB6700:
         Args:
             milliseconds: Delay time between 3000 and 60000 ms
         """
-        if milliseconds < 3000 or milliseconds > 60000:
-            raise ValueError("Delay must be 3000-60000 ms")
-        self._set(f"ONDELAY {milliseconds}")
-
-    def get_on_delay(self):
-        """Get laser turn-on delay in milliseconds."""
-        response = self._query("ONDELAY?")
-        return int(response)
+        _check_range(milliseconds, *_RANGES["on_delay"])
+        self._set(b"ONDELAY " + _encode_value(milliseconds))
 
     def set_output(self, state):
         """Turn laser output on or off.
@@ -275,41 +541,16 @@ class TLB6700:
         Args:
             state: True/'ON'/1 for on, False/'OFF'/0 for off
         """
-        if isinstance(state, bool):
-            value = "ON" if state else "OFF"
-        elif isinstance(state, int):
-            value = "ON" if state else "OFF"
-        else:
-            value = state.upper()
-
-        if value not in ["ON", "OFF"]:
+        value = _OUTPUT_MAP.get(state)
+        if value is None and isinstance(state, str):
+            value = _OUTPUT_MAP.get(state.upper())
+        if value is None:
             raise ValueError("State must be ON or OFF")
-        self._set(f"OUTPut:STATe {value}")
+        self._set(b"OUTPut:STATe " + value)
 
     def get_output(self):
         """Get laser output state."""
-        response = self._query("OUTPut:STATe?")
-        return response == "1"
-
-    def get_diode_current(self):
-        """Get actual diode current in mA."""
-        response = self._query("SENSe:CURRent:DIODe")
-        return float(response)
-
-    def get_diode_temperature(self):
-        """Get actual diode temperature in °C."""
-        response = self._query("SENSe:TEMPerature:DIODe")
-        return float(response)
-
-    def get_cavity_temperature(self):
-        """Get actual cavity temperature in °C."""
-        response = self._query("SENSe:TEMPerature:CAVity")
-        return float(response)
-
-    def get_auxiliary_voltage(self):
-        """Get auxiliary detector input voltage in V."""
-        response = self._query("SENSe:VOLTage:AUXiliary")
-        return float(response)
+        return self._query_raw(b"OUTPut:STATe?") == b"1"
 
     def set_diode_current(self, current):
         """Set diode current setpoint.
@@ -317,15 +558,7 @@ class TLB6700:
         Args:
             current: Current in mA or 'MAX' for maximum rating
         """
-        if isinstance(current, str):
-            if current.upper() != "MAX":
-                raise ValueError("String value must be 'MAX'")
-        self._set(f"SOURce:CURRent:DIODe {current}")
-
-    def get_diode_current_setpoint(self):
-        """Get diode current setpoint in mA."""
-        response = self._query("SOURce:CURRent:DIODe?")
-        return float(response)
+        self._set(b"SOURce:CURRent:DIODe " + _encode_setpoint(current))
 
     def set_diode_power_setpoint(self, power):
         """Set diode power setpoint.
@@ -333,34 +566,11 @@ class TLB6700:
         Args:
             power: Power in mW or 'MAX' for maximum rating
         """
-        if isinstance(power, str):
-            if power.upper() != "MAX":
-                raise ValueError("String value must be 'MAX'")
-        self._set(f"SOURCE:POWER:DIODE {power}")
-
-    def get_diode_power_setpoint(self):
-        """Get diode power setpoint in mW."""
-        response = self._query("SOURCE:POWER:DIODE?")
-        return float(response)
-
-    def get_power(self):
-        """Get detected diode power."""
-        response = self._query("SENSE:POWER:DIODE?")
-        return float(response)
+        self._set(b"SOURCE:POWER:DIODE " + _encode_setpoint(power))
 
     def set_wavelength_setpoint(self, wavelength):
         """Set wavelength setpoint in nm."""
-        self._set(f"SOURCE:WAVELENGTH {float(wavelength)}")
-
-    def get_wavelength_setpoint(self):
-        """Get wavelength setpoint in nm."""
-        response = self._query("SOURCE:WAVELENGTH?")
-        return float(response)
-
-    def get_wavelength(self):
-        """Get wavelength in nm."""
-        response = self._query("SENSE:WAVELENGTH?")
-        return float(response)
+        self._set(b"SOURCE:WAVELENGTH " + _encode_value(float(wavelength)))
 
     def set_lambda_track(self, track):
         """Set lambda track state.
@@ -368,12 +578,11 @@ class TLB6700:
         Args:
             track: boolean True if turn on lambda track
         """
-        self._set(f"OUTPUT:TRACK {1 if track else 0}")
+        self._set(b"OUTPUT:TRACK 1" if track else b"OUTPUT:TRACK 0")
 
     def get_lambda_track(self):
         """Get if lambda track is on."""
-        response = self._query("OUTPUT:TRACK?")
-        return bool(int(response))
+        return bool(self._query_int(b"OUTPUT:TRACK?"))
 
     def set_piezo_voltage(self, voltage):
         """Set piezo voltage setpoint.
@@ -381,35 +590,9 @@ class TLB6700:
         Args:
             voltage: Voltage as percentage (0-100) or 'MAX' for 100%
         """
-        if isinstance(voltage, str):
-            if voltage.upper() != "MAX":
-                raise ValueError("String value must be 'MAX'")
-            value = "MAX"
-        else:
-            if voltage < 0 or voltage > 100:
-                raise ValueError("Voltage must be 0-100%")
-            value = voltage
-        self._set(f"SOURce:VOLTage:PIEZo {value}")
-
-    def get_piezo_voltage_setpoint(self):
-        """Get piezo voltage setpoint as percentage."""
-        response = self._query("SOURce:VOLTage:PIEZo?")
-        return float(response)
-
-    def get_diode_temperature_setpoint(self):
-        """Get diode temperature setpoint in °C."""
-        response = self._query("SOURce:TEMPerature:DIODe?")
-        return float(response)
-
-    def get_cavity_temperature_setpoint(self):
-        """Get cavity temperature setpoint in °C."""
-        response = self._query("SOURce:TEMPerature:CAVity?")
-        return float(response)
-
-    def get_enable_time(self):
-        """Get total laser enable time in minutes."""
-        response = self._query("SYSTem:ENTIME?")
-        return int(response)
+        if not isinstance(voltage, str):
+            _check_range(voltage, *_RANGES["piezo_voltage"])
+        self._set(b"SOURce:VOLTage:PIEZo " + _encode_setpoint(voltage))
 
     def set_control_mode(self, mode):
         """Set controller operation mode.
@@ -417,40 +600,161 @@ class TLB6700:
         Args:
             mode: 'REM' for remote, 'LOC' for local
         """
-        if mode not in ["REM", "LOC"]:
+        value = _CONTROL_MODES.get(mode)
+        if value is None:
             raise ValueError("Mode must be 'REM' or 'LOC'")
-        self._set(f"SYSTem:MCONtrol {mode}")
-
-    def get_control_mode(self):
-        """Get controller operation mode ('REM' or 'LOC')."""
-        return self._query("SYSTem:MCONtrol?")
+        self._set(b"SYSTem:MCONtrol " + value)
 
     def get_laser_model(self):
         """Get laser head model number."""
-        return self._query("SYSTem:LASer:MODEL?")
+        return self._query_identity(b"SYSTem:LASer:MODEL?")
 
     def get_laser_serial(self):
         """Get laser head serial number."""
-        return self._query("SYSTem:LASer:SN?")
+        return self._query_identity(b"SYSTem:LASer:SN?")
 
     def get_laser_revision(self):
         """Get laser head revision number."""
-        return self._query("SYSTem:LASer:REV?")
+        return self._query_identity(b"SYSTem:LASer:REV?")
 
     def get_laser_calibration_date(self):
         """Get laser head calibration date."""
-        return self._query("SYSTem:LASer:CALDATE?")
-
-
-def list_devices(dll_path=None):
+        return self._query_identity(b"SYSTem:LASer:CALDATE?")
+
+
+# Getters that send a fixed query and parse the response, mapping method
+# name to (command, docstring). They are added to TLB6700 below.
+_FLOAT_QUERIES = {
+    "get_diode_current": (
+        b"SENSe:CURRent:DIODe",
+        "Get actual diode current in mA.",
+    ),
+    "get_diode_temperature": (
+        b"SENSe:TEMPerature:DIODe",
+        "Get actual diode temperature in °C.",
+    ),
+    "get_cavity_temperature": (
+        b"SENSe:TEMPerature:CAVity",
+        "Get actual cavity temperature in °C.",
+    ),
+    "get_auxiliary_voltage": (
+        b"SENSe:VOLTage:AUXiliary",
+        "Get auxiliary detector input voltage in V.",
+    ),
+    "get_diode_current_setpoint": (
+        b"SOURce:CURRent:DIODe?",
+        "Get diode current setpoint in mA.",
+    ),
+    "get_diode_power_setpoint": (
+        b"SOURCE:POWER:DIODE?",
+        "Get diode power setpoint in mW.",
+    ),
+    "get_power": (
+        b"SENSE:POWER:DIODE?",
+        "Get detected diode power.",
+    ),
+    "get_wavelength_setpoint": (
+        b"SOURCE:WAVELENGTH?",
+        "Get wavelength setpoint in nm.",
+    ),
+    "get_wavelength": (
+        b"SENSE:WAVELENGTH?",
+        "Get wavelength in nm.",
+    ),
+    "get_piezo_voltage_setpoint": (
+        b"SOURce:VOLTage:PIEZo?",
+        "Get piezo voltage setpoint as percentage.",
+    ),
+    "get_diode_temperature_setpoint": (
+        b"SOURce:TEMPerature:DIODe?",
+        "Get diode temperature setpoint in °C.",
+    ),
+    "get_cavity_temperature_setpoint": (
+        b"SOURce:TEMPerature:CAVity?",
+        "Get cavity temperature setpoint in °C.",
+    ),
+}
+
+_INT_QUERIES = {
+    "get_brightness": (
+        b"BRIGHT?",
+        "Get display brightness percentage.",
+    ),
+    "get_lockout": (
+        b"LOCKOUT?",
+        "Get front panel lockout state.",
+    ),
+    "get_on_delay": (
+        b"ONDELAY?",
+        "Get laser turn-on delay in milliseconds.",
+    ),
+    "get_enable_time": (
+        b"SYSTem:ENTIME?",
+        "Get total laser enable time in minutes.",
+    ),
+}
+
+_STR_QUERIES = {
+    "get_error_string": (
+        b"ERRSTR?",
+        "Get next error from error buffer.",
+    ),
+    "get_control_mode": (
+        b"SYSTem:MCONtrol?",
+        "Get controller operation mode ('REM' or 'LOC').",
+    ),
+}
+
+
+def _make_query(name, command, query_method, doc):
+    def query(self):
+        return query_method(self, command)
+
+    query.__name__ = name
+    query.__qualname__ = f"TLB6700.{name}"
+    query.__doc__ = doc
+    return query
+
+
+for _queries, _query_method in (
+    (_FLOAT_QUERIES, TLB6700._query_float),
+    (_INT_QUERIES, TLB6700._query_int),
+    (_STR_QUERIES, TLB6700._query),
+):
+    for _name, (_command, _doc) in _queries.items():
+        setattr(
+            TLB6700, _name, _make_query(_name, _command, _query_method, _doc)
+        )
+del _queries, _query_method, _name, _command, _doc
+
+# Sensors read together by TLB6700.read_sensor_snapshot()
+_SENSOR_NAMES = (
+    "diode_current",
+    "diode_temperature",
+    "cavity_temperature",
+    "auxiliary_voltage",
+    "power",
+    "wavelength",
+)
+_SENSOR_SNAPSHOT_CMD = b";".join(
+    _FLOAT_QUERIES[f"get_{name}"][0] for name in _SENSOR_NAMES
+)
+
+
+def list_devices(dll_path=None, force=False):
     """Convenience function to list all connected TLB-6700 devices.
 
+    The USB system is only initialized on the first call, so controllers
+    plugged in later are not seen unless force is set.
+
     Args:
         dll_path: Optional path to UsbDll.dll
+        force: Re-initialize the USB system to pick up newly connected
+            devices
 
     Returns:
         List of tuples (device_id, description)
     """
     usb = NewportUSB(dll_path)
-    usb.init_system()
+    usb.init_system(force=force)
     return usb.list_devices()
@@ -1,3 +1,4 @@
+import ctypes
 import json
 from pathlib import Path
 
@@ -17,3 +18,83 @@ def user_filesystem(tmp_path):
         json.dump(home_config_data, f)
 
     yield tmp_path
+
+
+class FakeUsbDll:
+    """Stand-in for UsbDll.dll that records commands and replays
+    scripted replies."""
+
+    def __init__(self, name):
+        self.name = name
+        self.sent = []
+        self.sent_terminated = []
+        self.replies = []
+        self.chunk_size = None
+        self.get_result = 0
+        self.device_info = b""
+        self.init_calls = 0
+        self.info_calls = 0
+        self._pending = b""
+
+        self.newp_usb_init_system = self._function(self._init_system)
+        self.newp_usb_uninit_system = self._function(lambda: None)
+        self.newp_usb_get_device_info = self._function(self._get_device_info)
+        self.newp_usb_send_ascii = self._function(self._send_ascii)
+        self.newp_usb_get_ascii = self._function(self._get_ascii)
+
+    @staticmethod
+    def _function(impl):
+        def function(*args):
+            return impl(*args)
+
+        return function
+
+    def _init_system(self):
+        self.init_calls += 1
+        return 0
+
+    def _get_device_info(self, buffer):
+        self.info_calls += 1
+        ctypes.memmove(buffer, self.device_info, len(self.device_info))
+        return 0
+
+    def _send_ascii(self, device_id, command, length):
+        self.sent.append(ctypes.string_at(command, length.value))
+        self.sent_terminated.append(ctypes.string_at(command))
+        self._pending = self.replies.pop(0) if self.replies else b"OK\r\n"
+        return 0
+
+    def _get_ascii(self, device_id, buffer, capacity, bytes_read):
+        size = self.chunk_size or capacity.value
+        chunk, self._pending = self._pending[:size], self._pending[size:]
+        ctypes.memmove(buffer, chunk, len(chunk))
+        bytes_read._obj.value = len(chunk)
+        return self.get_result
+
+
+@pytest.fixture
+def dll_loads(monkeypatch):
+    """Patch ctypes.WinDLL with FakeUsbDll and reset the NewportUSB
+    singleton; returns the list of fake DLLs loaded."""
+    from newport_tlb6700 import NewportUSB
+
+    dlls = []
+
+    def load(name):
+        dlls.append(FakeUsbDll(name))
+        return dlls[-1]
+
+    monkeypatch.setattr(ctypes, "WinDLL", load, raising=False)
+    monkeypatch.setattr(NewportUSB, "_instance", None)
+    monkeypatch.setattr(NewportUSB, "_initialized", False)
+    monkeypatch.setattr(NewportUSB, "_system_initialized", False)
+    monkeypatch.setattr(NewportUSB, "_dll_path", None)
+    return dlls
+
+
+@pytest.fixture
+def fake_dll(dll_loads):
+    from newport_tlb6700 import NewportUSB
+
+    NewportUSB()
+    return dll_loads[0]
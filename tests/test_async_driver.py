@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from newport_tlb6700 import AsyncTLB6700
+
+
+def test_futures_run_in_order(fake_dll):
+    fake_dll.replies = [b"OK\r\n", b"1.5\r\n", b"OK\r\n"]
+    with AsyncTLB6700(1) as laser:
+        futures = [
+            laser.set_brightness_async(50),
+            laser.get_power_async(),
+            laser.set_output_async(True),
+        ]
+        assert [future.result(timeout=5) for future in futures] == [
+            None,
+            1.5,
+            None,
+        ]
+    assert fake_dll.sent == [
+        b"BRIGHT 50",
+        b"SENSE:POWER:DIODE?",
+        b"OUTPut:STATe ON",
+    ]
+
+
+def test_future_exception(fake_dll):
+    with AsyncTLB6700(1) as laser:
+        with pytest.raises(ValueError):
+            laser.set_brightness_async(0).result(timeout=5)
+
+
+def test_coroutines(fake_dll):
+    fake_dll.replies = [b"1.5\r\n", b"1550.25\r\n"]
+
+    async def read(laser):
+        return await asyncio.gather(laser.get_power(), laser.get_wavelength())
+
+    with AsyncTLB6700(1) as laser:
+        assert asyncio.run(read(laser)) == [1.5, 1550.25]
+
+
+def test_close(fake_dll):
+    laser = AsyncTLB6700(1)
+    futures = [laser.get_power_async() for _ in range(5)]
+    laser.close()
+    assert all(future.done() for future in futures)
+    assert not laser._thread.is_alive()
+    with pytest.raises(RuntimeError, match="closed"):
+        laser.get_power_async()
+    laser.close()
+
+
+def test_keyword_arguments(fake_dll):
+    fake_dll.replies = [b"OK\r\n", b"OK\r\n"]
+
+    async def set_brightness(laser):
+        return await laser.set_brightness(brightness=50)
+
+    with AsyncTLB6700(1) as laser:
+        laser.set_output_async(state=True).result(timeout=5)
+        asyncio.run(set_brightness(laser))
+    assert fake_dll.sent == [b"OUTPut:STATe ON", b"BRIGHT 50"]
@@ -0,0 +1,328 @@
+import ctypes
+import threading
+import time
+
+import pytest
+
+from newport_tlb6700 import NewportUSB, TLB6700, list_devices
+
+
+@pytest.mark.parametrize(
+    "reply, chunk_size, expected",
+    [
+        # C1: whole reply in one read, expect parsed value
+        (b"1550.25\r\n", None, 1550.25),
+        # C2: reply split over several reads, expect reassembled value
+        (b"1550.25\r\n", 2, 1550.25),
+        # C3: line feed left over from the previous reply, expect it skipped
+        (b"\n1550.25\r\n", 3, 1550.25),
+    ],
+)
+def test_read_reply(fake_dll, reply, chunk_size, expected):
+    fake_dll.replies = [reply]
+    fake_dll.chunk_size = chunk_size
+    laser = TLB6700(1)
+    assert laser.get_wavelength() == expected
+    assert fake_dll.sent == [b"SENSE:WAVELENGTH?"]
+
+
+def test_read_timeout_reports_error_code(fake_dll):
+    fake_dll.replies = [b""]
+    fake_dll.get_result = -5
+    laser = TLB6700(1, timeout=0.01)
+    with pytest.raises(RuntimeError, match="error code -5"):
+        laser.get_wavelength()
+
+
+def test_query_error(fake_dll):
+    fake_dll.replies = [b"ERROR 12\r\n"]
+    laser = TLB6700(1)
+    with pytest.raises(RuntimeError, match="ERROR 12"):
+        laser.get_power()
+
+
+def test_query_many(fake_dll):
+    fake_dll.replies = [b"1;2.5\r\n"]
+    laser = TLB6700(1)
+    assert laser.query_many(["A?", "B?"]) == ["1", "2.5"]
+    assert fake_dll.sent == [b"A?;B?"]
+
+
+def test_query_many_empty(fake_dll):
+    laser = TLB6700(1)
+    with pytest.raises(ValueError):
+        laser.query_many([])
+    assert fake_dll.sent == []
+
+
+@pytest.mark.parametrize(
+    "reply, message",
+    [
+        # C1: error in a later field, expect RuntimeError with that field
+        (b"1;ERROR 5\r\n", "ERROR 5"),
+        # C2: fewer fields than queries
+        (b"1\r\n", "Expected 2 responses"),
+    ],
+)
+def test_query_many_bad_reply(fake_dll, reply, message):
+    fake_dll.replies = [reply]
+    laser = TLB6700(1)
+    with pytest.raises(RuntimeError, match=message):
+        laser.query_many(["A?", "B?"])
+
+
+def test_read_sensor_snapshot(fake_dll):
+    fake_dll.replies = [b"150;25.1;30.2;0.5;12;1550.25\r\n"]
+    laser = TLB6700(1)
+    assert laser.read_sensor_snapshot() == {
+        "diode_current": 150.0,
+        "diode_temperature": 25.1,
+        "cavity_temperature": 30.2,
+        "auxiliary_voltage": 0.5,
+        "power": 12.0,
+        "wavelength": 1550.25,
+    }
+    assert len(fake_dll.sent) == 1
+
+
+def test_read_sensor_snapshot_error_field(fake_dll):
+    fake_dll.replies = [b"150;25.1;ERROR 3;0.5;12;1550.25\r\n"]
+    laser = TLB6700(1)
+    with pytest.raises(RuntimeError, match="ERROR 3"):
+        laser.read_sensor_snapshot()
+
+
+def test_identity_cache(fake_dll):
+    fake_dll.replies = [b"NEWPORT TLB-6700\r\n", b"NEWPORT TLB-6700\r\n"]
+    laser = TLB6700(1)
+    assert laser.get_identification() == "NEWPORT TLB-6700"
+    assert laser.get_identification() == "NEWPORT TLB-6700"
+    assert len(fake_dll.sent) == 1
+    laser.invalidate_identity_cache()
+    laser.get_identification()
+    assert len(fake_dll.sent) == 2
+
+
+@pytest.mark.parametrize("make", [NewportUSB, lambda: TLB6700(1)])
+def test_concurrent_construction_loads_dll_once(dll_loads, monkeypatch, make):
+    load = ctypes.WinDLL
+
+    def slow_load(name):
+        # Widen the window in which an unlocked check would race
+        time.sleep(0.01)
+        return load(name)
+
+    monkeypatch.setattr(ctypes, "WinDLL", slow_load)
+    barrier = threading.Barrier(8)
+    instances = []
+
+    def construct():
+        barrier.wait()
+        instances.append(make())
+
+    threads = [threading.Thread(target=construct) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(dll_loads) == 1
+    assert len(instances) == 8
+
+
+@pytest.mark.parametrize(
+    "method, value, expected",
+    [
+        # C1: float arguments are sent unchanged, not truncated
+        ("set_brightness", 50.7, b"BRIGHT 50.7"),
+        ("set_on_delay", 3000, b"ONDELAY 3000"),
+        # C2: setpoints accept numbers or 'MAX'
+        ("set_diode_current", 150, b"SOURce:CURRent:DIODe 150"),
+        ("set_diode_current", "max", b"SOURce:CURRent:DIODe MAX"),
+        ("set_wavelength_setpoint", 1550, b"SOURCE:WAVELENGTH 1550.0"),
+        # C3: output state accepts bools, ints and strings
+        ("set_output", True, b"OUTPut:STATe ON"),
+        ("set_output", 0, b"OUTPut:STATe OFF"),
+        ("set_output", "On", b"OUTPut:STATe ON"),
+    ],
+)
+def test_set_command(fake_dll, method, value, expected):
+    laser = TLB6700(1)
+    getattr(laser, method)(value)
+    assert fake_dll.sent == [expected]
+
+
+@pytest.mark.parametrize(
+    "method, value, message",
+    [
+        ("set_brightness", 0, "Brightness must be 1-100%"),
+        ("set_on_delay", 10, "On delay must be 3000-60000 ms"),
+        ("save_settings", 1, "Save bin must be 2-5"),
+        ("set_piezo_voltage", 101, "Piezo voltage must be 0-100%"),
+        ("set_output", 2, "State must be ON or OFF"),
+        ("set_control_mode", "X", "Mode must be 'REM' or 'LOC'"),
+    ],
+)
+def test_set_command_bad_argument(fake_dll, method, value, message):
+    laser = TLB6700(1)
+    with pytest.raises(ValueError, match=message):
+        getattr(laser, method)(value)
+    assert fake_dll.sent == []
+
+
+def test_pipeline(fake_dll):
+    fake_dll.replies = [b"OK;OK;OK\r\n"]
+    laser = TLB6700(1)
+    with laser.pipeline():
+        laser.set_wavelength_setpoint(1550)
+        laser.set_diode_current(150)
+        laser.set_output(True)
+        assert fake_dll.sent == []
+    assert fake_dll.sent == [
+        b"SOURCE:WAVELENGTH 1550.0;SOURce:CURRent:DIODe 150;OUTPut:STATe ON"
+    ]
+
+
+def test_pipeline_query_flushes_first(fake_dll):
+    fake_dll.replies = [b"OK\r\n", b"12\r\n", b"OK\r\n"]
+    laser = TLB6700(1)
+    with laser.pipeline():
+        laser.set_brightness(50)
+        assert laser.get_power() == 12.0
+        laser.set_output(False)
+    assert fake_dll.sent == [
+        b"BRIGHT 50",
+        b"SENSE:POWER:DIODE?",
+        b"OUTPut:STATe OFF",
+    ]
+
+
+@pytest.mark.parametrize(
+    "reply, message",
+    [
+        # C1: one OK for three commands, expect the count to be checked
+        (b"OK\r\n", "Expected 3 responses"),
+        # C2: one command rejected
+        (b"OK;ERROR 1;OK\r\n", "Command failed"),
+    ],
+)
+def test_pipeline_bad_reply(fake_dll, reply, message):
+    fake_dll.replies = [reply]
+    laser = TLB6700(1)
+    with pytest.raises(RuntimeError, match=message):
+        with laser.pipeline():
+            laser.set_brightness(50)
+            laser.set_beep(1)
+            laser.set_output(True)
+
+
+def test_pipeline_not_sent_on_exception(fake_dll):
+    laser = TLB6700(1)
+    with pytest.raises(KeyError):
+        with laser.pipeline():
+            laser.set_brightness(50)
+            raise KeyError
+    assert fake_dll.sent == []
+
+
+def test_pipeline_disabled(fake_dll):
+    laser = TLB6700(1, pipelining=False)
+    with laser.pipeline():
+        laser.set_brightness(50)
+        laser.set_beep(1)
+    assert fake_dll.sent == [b"BRIGHT 50", b"BEEP 1"]
+
+
+def test_tx_buffer_has_no_stale_bytes(fake_dll):
+    laser = TLB6700(1)
+    laser.set_wavelength_setpoint(1550)
+    laser.set_beep(1)
+    assert fake_dll.sent[-1] == b"BEEP 1"
+    assert fake_dll.sent_terminated[-1] == b"BEEP 1"
+
+
+def test_long_command_grows_tx_buffer(fake_dll):
+    commands = ["SENSE:WAVELENGTH?"] * 100
+    fake_dll.replies = [b";".join([b"1.0"] * 100) + b"\r\n"]
+    laser = TLB6700(1)
+    assert laser.query_many(commands) == ["1.0"] * 100
+    expected = ";".join(commands).encode("ascii")
+    assert fake_dll.sent_terminated == [expected]
+
+
+def _pipelined_recall(laser):
+    with laser.pipeline():
+        laser.set_brightness(50)
+        laser.recall_settings(1)
+
+
+@pytest.mark.parametrize(
+    "call, replies, expected",
+    [
+        # C1: slow state changes, expect their settle time
+        (lambda laser: laser.reset(), [b"OK\r\n"], [0.5]),
+        (lambda laser: laser.recall_settings(1), [b"OK\r\n"], [0.25]),
+        (lambda laser: laser.save_settings(2), [b"OK\r\n"], [0.25]),
+        # C2: slow command inside a batch, expect its settle time
+        (_pipelined_recall, [b"OK;OK\r\n"], [0.25]),
+        # C3: ordinary commands, expect no wait
+        (lambda laser: laser.get_power(), [b"1.5\r\n"], []),
+        (lambda laser: laser.get_identification(), [b"ID\r\n"], []),
+        (lambda laser: laser.set_brightness(50), [b"OK\r\n"], []),
+    ],
+)
+def test_settle_time(fake_dll, monkeypatch, call, replies, expected):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    fake_dll.replies = replies
+    call(TLB6700(1))
+    assert sleeps == expected
+
+
+def test_list_devices_ttl(fake_dll):
+    usb = NewportUSB()
+    usb.enum_ttl = 60
+    fake_dll.device_info = b"1,A;"
+    assert usb.list_devices() == [(1, "A")]
+
+    fake_dll.device_info = b"2,B;"
+    assert usb.list_devices() == [(1, "A")]
+    assert fake_dll.info_calls == 1
+
+    usb.enum_ttl = 0
+    assert usb.list_devices() == [(2, "B")]
+    assert fake_dll.info_calls == 2
+
+
+def test_later_constructor_arguments_ignored(fake_dll):
+    usb = NewportUSB()
+    assert NewportUSB("other.dll", enum_ttl=0) is usb
+    assert usb.enum_ttl == 1.0
+    assert fake_dll.name == "UsbDll.dll"
+
+
+@pytest.mark.parametrize(
+    "device_info, expected",
+    [
+        # C1: several devices, expect (id, description) tuples
+        (
+            b"1,TLB-6700 SN1;2,TLB-6700 SN2;",
+            [(1, "TLB-6700 SN1"), (2, "TLB-6700 SN2")],
+        ),
+        # C2: description containing a comma, expect it kept whole
+        (b"3,TLB-6700, rev B", [(3, "TLB-6700, rev B")]),
+        # C3: no devices, expect an empty list
+        (b"", []),
+    ],
+)
+def test_list_devices_parsing(fake_dll, device_info, expected):
+    fake_dll.device_info = device_info
+    assert NewportUSB().list_devices() == expected
+
+
+def test_list_devices_initializes_once(fake_dll):
+    list_devices()
+    list_devices()
+    assert fake_dll.init_calls == 1
+    list_devices(force=True)
+    assert fake_dll.init_calls == 2